@@ -3,4 +3,4 @@ from django.apps import AppConfig
 
 class FastPaginationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "fast_pagination"
+    name = "django_fast_pagination"
@@ -1,9 +1,9 @@
 """
 Module to interact with django settings
 """
-import re
-from dataclasses import dataclass, field
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Optional
 
 from django.conf import settings as django_settings
 
@@ -11,8 +11,11 @@ from django.conf import settings as django_settings
 # is used with star import. E.g: `from module import *`
 __all__ = ["settings"]
 
+# `slots` is only supported by dataclasses on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Settings:
     """
     Django Fast Pagination Settings Container
@@ -40,36 +43,52 @@ class Settings:
         """
         # Add "?" query param indicator at end of base url
         # in case the user forgot it
+        # (dataclass is frozen, so fields are set through `object.__setattr__`)
         if not self.BASE_RESPONSE_URL.endswith("?"):
-            self.BASE_RESPONSE_URL += "?"
+            object.__setattr__(self, "BASE_RESPONSE_URL", f"{self.BASE_RESPONSE_URL}?")
         # merge response url and page size query parameter
-        self.EXAMPLE_URL = (
-            f"{self.BASE_RESPONSE_URL}{self.PAGE_SIZE_QUERY_PARAM}={self.PAGE_SIZE}"
+        object.__setattr__(
+            self,
+            "EXAMPLE_URL",
+            f"{self.BASE_RESPONSE_URL}{self.PAGE_SIZE_QUERY_PARAM}={self.PAGE_SIZE}",
         )
 
 
-# Get fast pagination config from django
-__configs = getattr(django_settings, "FAST_PAGINATION", {})
-# Filter out configs with `None` as values, and
-# keys that are not part of the desired configurations
-__configs = {
-    k: v
-    for k, v in __configs.items()
-    if v is not None and k in Settings.__annotations__.keys()
-}
-
-try:
-    # The exported settings object
-    settings = Settings(**__configs)
-
-except TypeError as err:
-    import fast_pagination.errors as errors
-
-    if "required positional argument" in str(err):
-        # Get missing variables with regex
-        missing_required_vars = re.findall("'([^']*)'", str(err))
-        raise errors.FastPaginationMissingSettingError(
-            " / ".join(missing_required_vars)
-        ) from err
-    else:
-        raise err
+# Settings that can be defined by the user. Derived
+# settings (e.g. EXAMPLE_URL) are not accepted.
+_INIT_FIELDS = frozenset(f.name for f in fields(Settings) if f.init)
+
+
+def _build_settings() -> Settings:
+    """
+    Builds the settings object from Django settings.
+    """
+    # Get fast pagination config from django
+    configs = getattr(django_settings, "FAST_PAGINATION", None) or {}
+    # Filter out configs with `None` as values, and
+    # keys that are not part of the desired configurations
+    configs = {
+        k: v
+        for k, v in configs.items()
+        if v is not None and k in _INIT_FIELDS
+    }
+
+    try:
+        return Settings(**configs)
+
+    except TypeError as err:
+        import django_fast_pagination.errors as errors
+
+        if "required positional argument" in str(err):
+            # Missing variables are the quoted names in the error message
+            parts = str(err).split("'")
+            missing_required_vars = parts[1::2]
+            raise errors.FastPaginationMissingSettingError(
+                " / ".join(missing_required_vars)
+            ) from err
+        else:
+            raise err
+
+
+# The exported settings object
+settings = _build_settings()
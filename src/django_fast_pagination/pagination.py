@@ -6,6 +6,7 @@ import sys
 
 from django.core.paginator import InvalidPage, Paginator
 from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 from rest_framework.exceptions import NotFound
 # Import "slow" pagination class as double underscore to avoid confusion
 # when importing our own pagination class
@@ -18,9 +19,54 @@ from django_fast_pagination.conf import settings
 # is used with star import. E.g: `from module import *`
 __all__ = ["FastPageNumberPagination"]
 
+# Accepted (lowercased) values for the `show_count` query parameter
+_TRUE_SET = frozenset(("true", "1", "yes", "on"))
+
+# Example links used in the OpenAPI response schema
+_NEXT_EXAMPLE = f"{settings.EXAMPLE_URL}&page=3"
+_PREV_EXAMPLE = f"{settings.EXAMPLE_URL}&page=1"
+
+# Static part of the OpenAPI paginated response schema,
+# `results` is added per call
+_SCHEMA_TEMPLATE = {
+    "type": "object",
+    "properties": {
+        "current_page": {
+            "type": "integer",
+            "example": 2,
+        },
+        "next": {
+            "type": "string",
+            "nullable": True,
+            "format": "uri",
+            "example": _NEXT_EXAMPLE,
+        },
+        "previous": {
+            "type": "string",
+            "nullable": True,
+            "format": "uri",
+            "example": _PREV_EXAMPLE,
+        },
+    },
+}
+
+
+# Marks a memoized link that was not computed yet
+_UNSET = object()
+
+
+def _always_false() -> bool:
+    return False
+
 
 def get_show_count_from_request(request) -> bool:
-    return request.query_params.get("show_count", "False").lower() == "true"
+    """Parses the `show_count` query parameter once per request
+    and memoizes the result on the request object."""
+    show_count = getattr(request, "_fp_show_count", None)
+    if show_count is None:
+        show_count = request.query_params.get("show_count", "").lower() in _TRUE_SET
+        request._fp_show_count = show_count
+    return show_count
 
 
 class NoCountQuery(Paginator):
@@ -36,16 +82,20 @@ class NoCountQuery(Paginator):
     def __init__(self, *args, **kwargs) -> None:
         self.request = kwargs.pop("request", None)
         super().__init__(*args, **kwargs)
-
-    @property
+        # Resolve `show_count` once, instead of on each `count` access
+        self.show_count: bool = self.request is not None and (
+            get_show_count_from_request(self.request)
+        )
+        if not self.show_count:
+            # Plain instance attribute, shadows the `count` descriptor
+            self.count = sys.maxsize
+
+    @cached_property
     def count(self) -> int:
-        """If `show_count` query parameter is true, an actual count
-        is performed. Otherwise (default behavior), we patch the count
-        with `sys.maxsize`."""
-        show_count: bool = get_show_count_from_request(self.request)
-        if show_count:
-            return super().count
-        return sys.maxsize
+        """Only reached if `show_count` query parameter is true, where
+        an actual count is performed. Otherwise (default behavior), the
+        count is patched with `sys.maxsize` on `__init__`."""
+        return super().count
 
 
 class FastPageNumberPagination(__):
@@ -64,19 +114,25 @@ class FastPageNumberPagination(__):
     template = "rest_framework/pagination/previous_and_next.html"
 
     def get_paginated_response(self, data):
+        page = self.page
+        get_next = self.get_next_link
+        get_previous = self.get_previous_link
         # Check if the response should include counting or not
-        show_count: bool = get_show_count_from_request(self.request)
-        if show_count:
-            response = {"count": self.page.paginator.count}
+        if get_show_count_from_request(self.request):
+            response = {
+                "count": page.paginator.count,
+                "current_page": page.number,
+                "next": get_next(),
+                "previous": get_previous(),
+                "results": data,
+            }
         else:
-            response = {}
-        # Add the common response
-        response |= {
-            "current_page": self.page.number,
-            "next": self.get_next_link(),
-            "previous": self.get_previous_link(),
-            "results": data,
-        }
+            response = {
+                "current_page": page.number,
+                "next": get_next(),
+                "previous": get_previous(),
+                "results": data,
+            }
         return Response(response)
 
     def get_schema_operation_parameters(self, view):
@@ -94,7 +150,10 @@ class FastPageNumberPagination(__):
                 "name": "show_count",
                 "required": False,
                 "in": "query",
-                "description": "Show count of total items",
+                "description": (
+                    "Show count of total items "
+                    "(accepts: true, 1, yes, on; case insensitive)"
+                ),
                 "schema": {
                     "type": "boolean",
                 },
@@ -119,35 +178,35 @@ class FastPageNumberPagination(__):
         Returns the OpenAPI schema for the default API pagination
         mechanism.
         """
-        return {
-            "type": "object",
-            "properties": {
-                "current_page": {
-                    "type": "integer",
-                    "example": 2,
-                },
-                "next": {
-                    "type": "string",
-                    "nullable": True,
-                    "format": "uri",
-                    "example": f"{settings.EXAMPLE_URL}&page=3",
-                },
-                "previous": {
-                    "type": "string",
-                    "nullable": True,
-                    "format": "uri",
-                    "example": f"{settings.EXAMPLE_URL}&page=1",
-                },
-                "results": schema,
-            },
+        # Copy each property, so callers can't mutate the template
+        properties = {
+            name: dict(prop) for name, prop in _SCHEMA_TEMPLATE["properties"].items()
         }
+        properties["results"] = schema
+        return {**_SCHEMA_TEMPLATE, "properties": properties}
+
+    def get_next_link(self):
+        # Memoized, since both the response and the browsable API need it
+        next_link = self.__dict__.get("_next_link", _UNSET)
+        if next_link is _UNSET:
+            next_link = self._next_link = super().get_next_link()
+        return next_link
+
+    def get_previous_link(self):
+        # Memoized, since both the response and the browsable API need it
+        previous_link = self.__dict__.get("_previous_link", _UNSET)
+        if previous_link is _UNSET:
+            previous_link = self._previous_link = super().get_previous_link()
+        return previous_link
 
     def get_html_context(self):
         """Specify the needed context for
         "rest_framework/pagination/previous_and_next.html" template rendering."""
+        get_next = self.get_next_link
+        get_previous = self.get_previous_link
         return {
-            "previous_url": self.get_previous_link(),
-            "next_url": self.get_next_link(),
+            "previous_url": get_previous(),
+            "next_url": get_next(),
         }
 
     def paginate_queryset(self, queryset, request, view):
@@ -161,21 +220,32 @@ class FastPageNumberPagination(__):
         page_number = self.get_page_number(request, paginator)
 
         try:
-            self.page = paginator.page(page_number)
+            # Normalizes the page number (e.g. "01" -> 1). Without `show_count`
+            # the count is `sys.maxsize`, so only non-positive or non-integer
+            # numbers are rejected and no database query is made.
+            page_number = paginator.validate_number(page_number)
         except InvalidPage as exc:
             msg = self.invalid_page_message.format(
                 page_number=page_number, message=str(exc)
             )
             raise NotFound(msg)
 
+        # Fetch one extra item to know if there is a next page, as the
+        # (patched) count can't tell it
+        bottom = (page_number - 1) * page_size
+        object_list = list(queryset[bottom : bottom + page_size + 1])
+        has_next = len(object_list) > page_size
+        del object_list[page_size:]
+        self.page = paginator._get_page(object_list, page_number, paginator)
+        if not has_next:
+            self.page.has_next = _always_false
+
         if paginator.num_pages > 1 and self.template is not None:
             # The browsable API should display pagination controls.
             self.display_page_controls = True
 
         self.request = request
-        qs = list(self.page)
-        # If queryset returned empty make sure we dont render any
-        # next link. We already ran out of data
-        if not qs:
-            self.page.has_next = lambda: False
-        return qs
+        # Drop links memoized for a previous page
+        self.__dict__.pop("_next_link", None)
+        self.__dict__.pop("_previous_link", None)
+        return self.page.object_list
@@ -0,0 +1,15 @@
+import django
+from django.conf import settings
+
+
+def pytest_configure():
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.contenttypes",
+            "django.contrib.auth",
+            "rest_framework",
+        ],
+        ALLOWED_HOSTS=["testserver"],
+        FAST_PAGINATION={"PAGE_SIZE": 5},
+    )
+    django.setup()
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+import pytest
+from django.test import override_settings
+
+from django_fast_pagination import conf
+from django_fast_pagination.errors import FastPaginationMissingSettingError
+
+
+def test_derived_settings_are_ignored():
+    with override_settings(FAST_PAGINATION={"PAGE_SIZE": 10, "EXAMPLE_URL": "ignored"}):
+        settings = conf._build_settings()
+    assert settings.PAGE_SIZE == 10
+    assert settings.EXAMPLE_URL == "https://ubiwhere.com/api/resource/?page_size=10"
+
+
+def test_missing_settings_error(monkeypatch):
+    @dataclass
+    class Settings:
+        FOO: str
+        BAR: str
+
+    monkeypatch.setattr(conf, "Settings", Settings)
+    with override_settings(FAST_PAGINATION={}):
+        with pytest.raises(FastPaginationMissingSettingError) as exc_info:
+            conf._build_settings()
+    assert "'FOO / BAR'" in str(exc_info.value)
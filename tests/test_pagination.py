@@ -0,0 +1,97 @@
+import pytest
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django_fast_pagination import FastPageNumberPagination
+from django_fast_pagination.pagination import get_show_count_from_request
+
+factory = APIRequestFactory()
+
+
+def paginate(items, query=""):
+    pagination = FastPageNumberPagination()
+    request = Request(factory.get(f"/items/{query}"))
+    results = pagination.paginate_queryset(items, request, view=None)
+    return pagination, results
+
+
+@pytest.mark.parametrize(
+    "n_items, query, expected_results, has_next",
+    [
+        # one item over the page size
+        (6, "", [0, 1, 2, 3, 4], True),
+        # page exactly full
+        (5, "", [0, 1, 2, 3, 4], False),
+        # empty first page
+        (0, "", [], False),
+        # later pages behave the same as the first one
+        (10, "?page=2", [5, 6, 7, 8, 9], False),
+        (11, "?page=2", [5, 6, 7, 8, 9], True),
+    ],
+)
+def test_next_link(n_items, query, expected_results, has_next):
+    pagination, results = paginate(list(range(n_items)), query)
+    assert results == expected_results
+    assert (pagination.get_next_link() is not None) is has_next
+
+
+def test_page_number_is_normalized():
+    pagination, results = paginate(list(range(6)), "?page=01")
+    assert pagination.page.number == 1
+    assert results == [0, 1, 2, 3, 4]
+
+
+def test_show_count_with_reused_pagination():
+    pagination, results = paginate(list(range(6)))
+    assert "count" not in pagination.get_paginated_response(results).data
+
+    request = Request(factory.get("/items/?show_count=true"))
+    results = pagination.paginate_queryset(list(range(6)), request, view=None)
+    assert pagination.get_paginated_response(results).data["count"] == 6
+
+
+def test_links_are_reset_on_new_page():
+    items = list(range(11))
+    pagination, _ = paginate(items)
+    assert pagination.get_previous_link() is None
+    assert pagination.get_next_link().endswith("page=2")
+
+    request = Request(factory.get("/items/?page=2"))
+    pagination.paginate_queryset(items, request, view=None)
+    assert pagination.get_previous_link().endswith("/items/")
+    assert pagination.get_next_link().endswith("page=3")
+
+
+def test_none_links_are_memoized(monkeypatch):
+    calls = []
+
+    def get_next_link(self):
+        calls.append(self)
+        return None
+
+    monkeypatch.setattr(PageNumberPagination, "get_next_link", get_next_link)
+    pagination, _ = paginate(list(range(3)))
+    assert pagination.get_next_link() is None
+    assert pagination.get_next_link() is None
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("?show_count=true", True),
+        ("?show_count=TRUE", True),
+        ("?show_count=1", True),
+        ("?show_count=yes", True),
+        ("?show_count=on", True),
+        ("?show_count=false", False),
+        ("?show_count=0", False),
+        ("", False),
+    ],
+)
+def test_show_count_from_request(query, expected):
+    request = Request(factory.get(f"/items/{query}"))
+    assert get_show_count_from_request(request) is expected
+    # The parsed value is memoized on the request
+    assert request._fp_show_count is expected